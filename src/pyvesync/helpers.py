@@ -3,10 +3,9 @@ from __future__ import annotations
 import hashlib
 import logging
 import time
-import colorsys
+from functools import lru_cache
 from dataclasses import dataclass, field, InitVar
 from typing import Any, NamedTuple, Union, Optional
-import re
 from enum import Enum
 import requests
 from .vesync_enums import EConfig
@@ -15,6 +14,84 @@ from .const import ERR_RATE_LIMITS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Key prefixes scanned by `Helpers.redactor`, lowercase for case-insensitive
+# matching. The bool flags JSON-style keys where the value is quoted, e.g.
+# 'token": "value"', as opposed to bare 'token value' pairs.
+_REDACT_TOKENS = (
+    ('token":', True),
+    ('password":', True),
+    ('email":', True),
+    ('tk":', True),
+    ('accountid":', True),
+    ('authkey":', True),
+    ('uuid":', True),
+    ('cid":', True),
+    ('token', False),
+    ('account_id', False),
+)
+
+_REDACTED = '##_REDACTED_##'
+
+
+@lru_cache(maxsize=1024)
+def _redact(value: str) -> str:
+    """Scan a string once and splice out values of sensitive keys.
+
+    Pollers log the same payload templates repeatedly, so results are
+    memoized on the input string.
+    """
+    lower = value.lower()
+    # Most log lines carry none of the sensitive keys - reject those
+    # with C-level substring checks before entering the splice loop
+    if not any(key in lower for key, _ in _REDACT_TOKENS):
+        return value
+    length = len(value)
+    find = lower.find
+    out = []
+    pos = 0
+    while pos < length:
+        match_start = -1
+        for key, quoted in _REDACT_TOKENS:
+            # Search slightly behind pos so a key whose value starts at
+            # pos is still found after an earlier splice
+            idx = find(key, max(0, pos - len(key) - 2))
+            while idx != -1:
+                start = idx + len(key)
+                if quoted:
+                    # Key is followed by one whitespace and opening quote
+                    if (start + 1 < length and value[start].isspace()
+                            and value[start + 1] == '"'):
+                        start += 2
+                    else:
+                        start = -1
+                elif start < length and value[start].isspace():
+                    start += 1
+                else:
+                    start = -1
+                if start >= pos:
+                    break
+                idx = find(key, idx + 1)
+            if idx == -1 or start < pos:
+                continue
+            if match_start == -1 or start < match_start:
+                match_start = start
+        if match_start == -1:
+            break
+        end = match_start
+        while end < length and value[end] != '"' and not value[end].isspace():
+            end += 1
+        if end > match_start:
+            out.append(value[pos:match_start])
+            out.append(_REDACTED)
+            pos = end
+        else:
+            # Empty value (quote or whitespace follows), nothing to redact
+            out.append(value[pos:match_start + 1])
+            pos = match_start + 1
+    out.append(value[pos:])
+    return ''.join(out)
+
+
 # Base api for all device requests-
 API_BASE_URL: str = 'https://smartapi.vesync.com'
 
@@ -22,6 +99,54 @@ API_BASE_URL: str = 'https://smartapi.vesync.com'
 # using 8 here so there is time enough to catch that message
 API_TIMEOUT = 8
 
+# Shared session so repeated calls reuse pooled keep-alive connections
+# instead of paying a TCP + TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount(
+    'https://',
+    requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20)
+)
+
+# Canonical verbs for the lowercase method names callers pass, so the hot
+# path does a dict lookup instead of building a new string per call
+_METHODS = {
+    'get': 'GET',
+    'post': 'POST',
+    'put': 'PUT',
+    'patch': 'PATCH',
+    'delete': 'DELETE',
+    'head': 'HEAD',
+}
+
+# (output key, API response key, default) tuples driving the response
+# dict builders below
+_DETAIL_KEYS = (
+    ('active_time', 'activeTime', 0),
+    ('energy', 'energy', 0),
+    ('night_light_status', 'nightLightStatus', None),
+    ('night_light_brightness', 'nightLightBrightness', None),
+    ('night_light_automode', 'nightLightAutomode', None),
+    ('power', 'power', 0),
+    ('voltage', 'voltage', 0),
+)
+
+_ENERGY_KEYS = (
+    ('energy_consumption_of_today', 'energyConsumptionOfToday', 0),
+    ('cost_per_kwh', 'costPerKWH', 0),
+    ('max_energy', 'maxEnergy', 0),
+    ('total_energy', 'totalEnergy', 0),
+    ('currency', 'currency', 0),
+    ('data', 'data', 0),
+)
+
+_CONFIG_KEYS = (
+    ('current_firmware_version', 'currentFirmVersion', None),
+    ('latest_firmware_version', 'latestFirmVersion', None),
+    ('maxPower', 'maxPower', None),
+    ('power_protection', 'powerProtectionStatus', None),
+    ('energy_saving_status', 'energySavingStatus', None),
+)
+
 NUMERIC = Union[int, float, str, None]
 
 DEVICE_CONFIGS_T = dict[str, dict[Enum, Union[list[Any], str]]]
@@ -29,13 +154,30 @@ DEVICE_CONFIGS_T = dict[str, dict[Enum, Union[list[Any], str]]]
 REQUEST_T = dict[str, Any]
 
 
+# Model maps keyed on (config table identity, config key) - the config
+# tables are module-level constants, so each map is built only once
+_MODEL_DICT_CACHE: dict[tuple[int, Enum], dict[str, Any]] = {}
+
+
+def _build_model_mapping(configurations, key) -> dict[str, Any]:
+    """Build and cache a model name to config value mapping."""
+    cache_key = (id(configurations), key)
+    mapping = _MODEL_DICT_CACHE.get(cache_key)
+    if mapping is None:
+        mapping = {
+            k: v.get(key) for v in configurations.values() for k in v[EConfig.MODELS]
+        }
+        _MODEL_DICT_CACHE[cache_key] = mapping
+    return mapping
+
+
 def build_model_dict(configurations, key) -> dict[str, str]:
     """Build a dict for the give model name to a corresponding class name."""
-    return {k: v.get(key) for v in configurations.values() for k in v[EConfig.MODELS]}
+    return _build_model_mapping(configurations, key)
 
 def build_model_dicts(configurations, key) -> dict[str, list[str]]:
     """Build a dict for the give model name to a corresponding class name."""
-    return {k: v.get(key) for v in configurations.values() for k in v[EConfig.MODELS]}
+    return _build_model_mapping(configurations, key)
 
 
 class Helpers:
@@ -49,8 +191,14 @@ class Helpers:
 
     @staticmethod
     def hash_password(string: str) -> str:
-        """Encode password."""
-        return hashlib.md5(string.encode('utf-8')).hexdigest()  # noqa: S324
+        """Encode password.
+
+        MD5 is the obfuscation VeSync's login API expects, not a security
+        primitive, so FIPS-mode checks are skipped.
+        """
+        return hashlib.md5(
+            string.encode('utf-8'), usedforsecurity=False
+        ).hexdigest()
 
     should_redact = True
 
@@ -78,26 +226,9 @@ class Helpers:
             str: The redacted string with sensitive information replaced
                 by '##_REDACTED_##'.
         """
-        if cls.should_redact:
-            value = re.sub(
-                (
-                    r"(?i)"
-                    r'((?<=token":\s")|'
-                    r'(?<=password":\s")|'
-                    r'(?<=email":\s")|'
-                    r'(?<=tk":\s")|'
-                    r'(?<=accountId":\s")|'
-                    r'(?<=authKey":\s")|'
-                    r'(?<=uuid":\s")|'
-                    r'(?<=cid":\s")|'
-                    r"(?<=token\s)|"
-                    r"(?<=account_id\s))"
-                    r'[^"\s]+'
-                ),
-                "##_REDACTED_##",
-                value,
-            )
-        return value
+        if not cls.should_redact:
+            return value
+        return _redact(value)
 
     @staticmethod
     def nested_code_check(response: REQUEST_T) -> bool:
@@ -109,12 +240,16 @@ class Helpers:
         Returns:
             bool: True if all code values are 0, False otherwise.
         """
-        if isinstance(response, dict):
-            for key, value in response.items():
-                if (key == 'code' and value != 0) or \
-                        (isinstance(value, dict) and
-                            not Helpers.nested_code_check(value)):
+        _dict = dict
+        if not isinstance(response, _dict):
+            return True
+        stack = [response]
+        while stack:
+            for key, value in stack.pop().items():
+                if key == 'code' and value != 0:
                     return False
+                if isinstance(value, _dict):
+                    stack.append(value)
         return True
 
     @staticmethod
@@ -137,13 +272,14 @@ class Helpers:
         Returns:
             dict: Response.
         """
-        response = None
+        # Untyped on purpose: a non-JSON 200 body is returned as raw text.
+        response: Any = None
 
         try:
-            call = getattr(requests, method.lower())
-            r = call(
-                API_BASE_URL + api, json=json_object, headers=headers,
-                timeout=API_TIMEOUT
+            r = _SESSION.request(
+                _METHODS.get(method) or method.upper(),
+                API_BASE_URL + api, json=json_object,
+                headers=headers, timeout=API_TIMEOUT
             )
         except Exception as e:
             LibraryLogger.log_api_exception(
@@ -159,20 +295,23 @@ class Helpers:
         else:
             if r.status_code == 200:
                 LibraryLogger.log_api_call(_LOGGER, r)
-                if LibraryLogger.is_json(r.text):
+                try:
                     response = r.json()
-                    if response.get('code') in ERR_RATE_LIMITS:
-                        LibraryLogger.log_api_exception(_LOGGER, request_dict={
-                            "method": method,
-                            "endpoint": api,
-                            "status_code": r.status_code,
-                            "headers": headers,
-                            "body": json_object,
-                            "response": response
-                        })
-                        raise VeSyncRateLimitError
+                except ValueError:
+                    # Covers both json.JSONDecodeError and simplejson's
+                    # JSONDecodeError, whichever requests delegates to.
+                    response = r.text
                     return response
-                response = r.text
+                if response.get('code') in ERR_RATE_LIMITS:
+                    LibraryLogger.log_api_exception(_LOGGER, request_dict={
+                        "method": method,
+                        "endpoint": api,
+                        "status_code": r.status_code,
+                        "headers": headers,
+                        "body": json_object,
+                        "response": response
+                    })
+                    raise VeSyncRateLimitError
                 return response
             LibraryLogger.log_api_exception(_LOGGER, request_dict={
                 "method": method,
@@ -215,15 +354,8 @@ class Helpers:
             }
 
         """
-        return {
-            'active_time': r.get('activeTime', 0),
-            'energy': r.get('energy', 0),
-            'night_light_status': r.get('nightLightStatus'),
-            'night_light_brightness': r.get('nightLightBrightness'),
-            'night_light_automode': r.get('nightLightAutomode'),
-            'power': r.get('power', 0),
-            'voltage': r.get('voltage', 0),
-        }
+        g = r.get
+        return {key: g(api_key, default) for key, api_key, default in _DETAIL_KEYS}
 
     @staticmethod
     def build_energy_dict(r: REQUEST_T) -> REQUEST_T:
@@ -238,15 +370,8 @@ class Helpers:
         Returns:
             dict: Energy dictionary.
         """
-        return {
-            'energy_consumption_of_today': r.get(
-                    'energyConsumptionOfToday', 0),
-            'cost_per_kwh': r.get('costPerKWH', 0),
-            'max_energy': r.get('maxEnergy', 0),
-            'total_energy': r.get('totalEnergy', 0),
-            'currency': r.get('currency', 0),
-            'data': r.get('data', 0),
-        }
+        g = r.get
+        return {key: g(api_key, default) for key, api_key, default in _ENERGY_KEYS}
 
     @staticmethod
     def build_config_dict(r: REQUEST_T) -> REQUEST_T:
@@ -277,18 +402,13 @@ class Helpers:
             }
 
         """
-        if r.get('threshold') is not None:
-            threshold = r.get('threshold')
-        else:
-            threshold = r.get('threshHold')
-        return {
-            'current_firmware_version': r.get('currentFirmVersion'),
-            'latest_firmware_version': r.get('latestFirmVersion'),
-            'maxPower': r.get('maxPower'),
-            'threshold': threshold,
-            'power_protection': r.get('powerProtectionStatus'),
-            'energy_saving_status': r.get('energySavingStatus'),
-        }
+        g = r.get
+        threshold = g('threshold')
+        if threshold is None:
+            threshold = g('threshHold')
+        config = {key: g(api_key, default) for key, api_key, default in _CONFIG_KEYS}
+        config['threshold'] = threshold
+        return config
 
     @staticmethod
     def named_tuple_to_str(named_tuple: NamedTuple) -> str:
@@ -304,10 +424,10 @@ class Helpers:
             >>> named_tuple_to_str(HSV(100, 50, 75))
             'hue: 100, saturation: 50, value: 75, '
         """
-        tuple_str = ''
-        for key, val in named_tuple._asdict().items():
-            tuple_str += f'{key}: {val}, '
-        return tuple_str
+        return ''.join(
+            f'{key}: {val}, '
+            for key, val in zip(named_tuple._fields, named_tuple)
+        )
 
 
 class HSV(NamedTuple):
@@ -344,7 +464,7 @@ class RGB(NamedTuple):
     blue: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Color:
     """Dataclass for color values.
 
@@ -403,11 +523,14 @@ class Color:
     def _min_max(value: float | str, min_val: float,
                  max_val: float, default: float) -> float:
         """Check if value is within min and max values."""
-        try:
-            val = max(min_val, (min(max_val, round(float(value), 2))))
-        except (ValueError, TypeError):
-            val = default
-        return val
+        # Values are usually numeric already - only strings need the
+        # guarded float() conversion
+        if type(value) not in (int, float):
+            try:
+                value = float(value)  # type: ignore[arg-type]
+            except (ValueError, TypeError):
+                return default
+        return max(min_val, min(max_val, round(float(value), 2)))
 
     @classmethod
     def valid_hsv(cls, h: float | str,
@@ -435,32 +558,52 @@ class Color:
     @staticmethod
     def hsv_to_rgb(hue: float, saturation: float, value: float) -> RGB:
         """Convert HSV to RGB."""
+        h = hue / 360
+        s = saturation / 100
+        v = value / 100
+        i = int(h * 6.0)
+        f = h * 6.0 - i
+        p = v * (1.0 - s)
+        q = v * (1.0 - s * f)
+        t = v * (1.0 - s * (1.0 - f))
+        r, g, b = (
+            (v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q)
+        )[i % 6]
         return RGB(
-            *tuple(round(i * 255, 0) for i in colorsys.hsv_to_rgb(
-                hue / 360,
-                saturation / 100,
-                value / 100
-            ))
+            round(r * 255, 0),
+            round(g * 255, 0),
+            round(b * 255, 0),
         )
 
     @staticmethod
     def rgb_to_hsv(red: float, green: float, blue: float) -> HSV:
         """Convert RGB to HSV."""
-        hsv_tuple = colorsys.rgb_to_hsv(
-                red / 255,
-                green / 255,
-                blue / 255
-            )
-        hsv_factors = [360, 100, 100]
-
+        r = red / 255
+        g = green / 255
+        b = blue / 255
+        max_c = max(r, g, b)
+        min_c = min(r, g, b)
+        range_c = max_c - min_c
+        v = max_c
+        if range_c == 0:
+            h = s = 0.0
+        else:
+            s = range_c / max_c
+            if r == max_c:
+                h = (max_c - b) / range_c - (max_c - g) / range_c
+            elif g == max_c:
+                h = 2.0 + (max_c - r) / range_c - (max_c - b) / range_c
+            else:
+                h = 4.0 + (max_c - g) / range_c - (max_c - r) / range_c
+            h = (h / 6.0) % 1.0
         return HSV(
-            float(round(hsv_tuple[0] * hsv_factors[0], 2)),
-            float(round(hsv_tuple[1] * hsv_factors[1], 2)),
-            float(round(hsv_tuple[2] * hsv_factors[2], 0)),
+            float(round(h * 360, 2)),
+            float(round(s * 100, 2)),
+            float(round(v * 100, 0)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Timer:
     """Dataclass to hold state of timers.
 
@@ -473,10 +616,10 @@ class Timer:
         action (str): Action to perform when timer is done
         id (int): ID of timer, defaults to 1
         remaining (int): Time remaining on timer in seconds, defaults to None
-        update_time (int): Last updated unix timestamp in seconds, defaults to None
+        update_time (float): Monotonic timestamp of last update, defaults to None
 
     Attributes:
-        update_time (str): Timestamp of last update
+        update_time (float): Monotonic timestamp of last update
         status (str): Status of timer, one of 'active', 'paused', 'done'
         time_remaining (int): Time remaining on timer in seconds
         running (bool): True if timer is running
@@ -489,8 +632,8 @@ class Timer:
     id: int = 1
     remaining: InitVar[int | None] = None
     _status: str = 'active'
-    _remain: int = 0
-    update_time: int | None = int(time.time())
+    _remain: float = 0
+    update_time: float | None = time.monotonic()
 
     def __post_init__(self, remaining: int | None) -> None:
         """Set remaining time if provided."""
@@ -515,23 +658,23 @@ class Timer:
             self.end()
             return
         if self.status == 'paused' and status == 'active':
-            self.update_time = int(time.time())
+            self.update_time = time.monotonic()
         if self.status == 'active' and status == 'paused':
             self.update_time = None
         self._status = status
 
     @property
-    def _seconds_since_check(self) -> int:
+    def _seconds_since_check(self) -> float:
         """Return seconds since last update."""
         if self.update_time is None:
             return 0
-        return int(time.time()) - self.update_time
+        return time.monotonic() - self.update_time
 
     @property
     def time_remaining(self) -> int:
         """Return remaining seconds."""
         self._internal_update()
-        return self._remain
+        return int(self._remain)
 
     @time_remaining.setter
     def time_remaining(self, remaining: int) -> None:
@@ -550,14 +693,16 @@ class Timer:
         if self._status == 'paused':
             self.update_time = None
             return
-        if self._status == 'done' or (self._seconds_since_check > self._remain
+        now = time.monotonic()
+        elapsed = 0 if self.update_time is None else now - self.update_time
+        if self._status == 'done' or (elapsed > self._remain
                                       and self._status == 'active'):
             self._status = 'done'
             self.update_time = None
             self._remain = 0
         if self._status == 'active':
-            self._remain = self._remain - self._seconds_since_check
-            self.update_time = int(time.time())
+            self._remain = self._remain - elapsed
+            self.update_time = now
 
     @property
     def running(self) -> bool:
@@ -584,7 +729,7 @@ class Timer:
         """Restart paused timer."""
         if self._status != 'paused':
             return
-        self.update_time = int(time.time())
+        self.update_time = time.monotonic()
         self.status = 'active'
 
     def update(self, *, time_remaining: int | None = None,
@@ -3,6 +3,7 @@
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Any,  Callable, Sequence
 
 from .vesync_enums import EDeviceFamily
@@ -15,16 +16,28 @@ from .const import (
 from .helpers import Helpers, REQUEST_T
 from .logs import LibraryLogger, VesyncLoginError, _LOGGER
 from .vesyncbasedevice import VeSyncBaseDevice
-from .vesyncbulb import factory as bulb_factory
-from .vesyncfan import factory as fan_factory
-from .vesynckitchen import factory as kitchen_factory
-from .vesyncoutlet import factory as outlet_factory
-from .vesyncswitch import factory as switch_factory
+from .vesyncbulb import bulb_classes, factory as bulb_factory
+from .vesyncfan import fan_classes, factory as fan_factory
+from .vesynckitchen import kitchen_classes, factory as kitchen_factory
+from .vesyncoutlet import outlet_classes, factory as outlet_factory
+from .vesyncswitch import switch_classes, factory as switch_factory
 
 FACTORIES: Sequence[Callable] = [
     bulb_factory, fan_factory, kitchen_factory, outlet_factory, switch_factory
 ]
 
+# Model to factory mapping resolved once at import, so object_factory
+# dispatches with a single dict lookup instead of probing every module.
+FACTORY_REGISTRY: dict[str, Callable] = {}
+for _classes, _factory in (
+    (bulb_classes, bulb_factory),
+    (fan_classes, fan_factory),
+    (kitchen_classes, kitchen_factory),
+    (outlet_classes, outlet_factory),
+    (switch_classes, switch_factory),
+):
+    FACTORY_REGISTRY.update(dict.fromkeys(_classes, _factory))
+
 
 class VeSync:  # pylint: disable=function-redefined
     """VeSync Manager Class."""
@@ -108,6 +121,11 @@ class VeSync:  # pylint: disable=function-redefined
         self.username = username
         self.password = password
         self._device_list: list[VeSyncBaseDevice] = []
+        self._req_headers: Optional[REQUEST_T] = None
+        self._req_headers_key: Optional[tuple] = None
+        self._req_body_base: Optional[REQUEST_T] = None
+        self._req_body_auth: Optional[REQUEST_T] = None
+        self._req_body_auth_key: Optional[tuple] = None
 
         if isinstance(time_zone, str) and time_zone:
             reg_test = r'[^a-zA-Z/_]'
@@ -225,7 +243,7 @@ class VeSync:  # pylint: disable=function-redefined
                             devices) if j not in dev_rem]
         return devices
 
-    def object_factory(self, details: dict) -> VeSyncBaseDevice:
+    def object_factory(self, details: dict) -> Optional[VeSyncBaseDevice]:
         """Get device type and instantiate class.
 
         Pulls the device types from each module to determine the type of device and
@@ -243,12 +261,13 @@ class VeSync:  # pylint: disable=function-redefined
         """
         dev_type = details.get('deviceType')
         dev_name = details.get('deviceName', '#MISS#')
-        for factory in FACTORIES:
+        device = None
+        factory = FACTORY_REGISTRY.get(dev_type) if dev_type is not None else None
+        if factory is not None:
             try:
                 device = factory(dev_type, details, self)
                 if device:
                     self._device_list.append(device)
-                    break
             except AttributeError as err:
                 _LOGGER.debug(
                     'Error - %s: device %s(%s) not added',
@@ -394,9 +413,23 @@ class VeSync:  # pylint: disable=function-redefined
             self.last_update_ts = time.time()
 
     def update_energy(self, bypass_check: bool = False) -> None:
-        """Fetch updated energy information for outlet devices."""
-        for outlet in self.outlets:
-            outlet.update_energy(bypass_check)
+        """Fetch updated energy information for outlet devices.
+
+        Each outlet's energy poll is an independent set of API round trips,
+        so outlets are polled concurrently instead of one after another.
+        """
+        outlets = self.outlets
+        if len(outlets) <= 1:
+            for outlet in outlets:
+                outlet.update_energy(bypass_check)
+            return
+        with ThreadPoolExecutor(max_workers=min(len(outlets), 8)) as pool:
+            futures = [
+                pool.submit(outlet.update_energy, bypass_check)
+                for outlet in outlets
+            ]
+            for future in futures:
+                future.result()
 
     def update_all_devices(self) -> None:
         """Run `get_details()` for each device and update state."""
@@ -470,15 +503,29 @@ class VeSync:  # pylint: disable=function-redefined
                 'tz': manager.time_zone,
             }
 
+        Note:
+            The header dict is built once per login session and reused for
+            every request; it is rebuilt when the token, account id or time
+            zone changes. Callers must not mutate the returned dict.
         """
-        return {
-            'accept-language': 'en',
-            'accountId': self.account_id,
-            'appVersion': APP_VERSION,
-            'content-type': 'application/json',
-            'tk': self.token,
-            'tz': self.time_zone,
-        }
+        cache_key = (self.account_id, self.token, self.time_zone)
+        if self._req_headers is None or self._req_headers_key != cache_key:
+            self._req_headers = {
+                'accept-language': 'en',
+                'accountId': self.account_id,
+                'appVersion': APP_VERSION,
+                'content-type': 'application/json',
+                'tk': self.token,
+                'tz': self.time_zone,
+            }
+            self._req_headers_key = cache_key
+        return self._req_headers
+
+    #: Constant bypass header, built once - callers must not mutate it.
+    _BYPASS_HEADERS: REQUEST_T = {
+        'Content-Type': 'application/json; charset=UTF-8',
+        'User-Agent': BYPASS_HEADER_UA,
+    }
 
     @staticmethod
     def req_header_bypass() -> REQUEST_T:
@@ -494,10 +541,7 @@ class VeSync:  # pylint: disable=function-redefined
                 'User-Agent': BYPASS_HEADER_UA,
             }
         """
-        return {
-            'Content-Type': 'application/json; charset=UTF-8',
-            'User-Agent': BYPASS_HEADER_UA,
-        }
+        return VeSync._BYPASS_HEADERS
 
     def post_device_managed_v1(self, body):
         """Return the response for a bypass V^ request with the given body."""
@@ -557,11 +601,19 @@ class VeSync:  # pylint: disable=function-redefined
                 'timeZone': manager.time_zone,
                 'acceptLanguage': 'en',
             }
+
+        Note:
+            Callers always spread the result into a new dict, so the
+            fragment is cached per manager and rebuilt only when the
+            time zone changes.
         """
-        return {
-            'timeZone': self.time_zone,
-            'acceptLanguage': 'en'
-        }
+        base = self._req_body_base
+        if base is None or base['timeZone'] != self.time_zone:
+            base = self._req_body_base = {
+                'timeZone': self.time_zone,
+                'acceptLanguage': 'en'
+            }
+        return base
 
     def req_body_auth(self) -> REQUEST_T:
         """Keys for authenticating api requests.
@@ -575,11 +627,19 @@ class VeSync:  # pylint: disable=function-redefined
                 'accountID': manager.account_id,
                 'token': manager.token,
             }
+
+        Note:
+            Cached per manager like `req_body_base` and rebuilt when the
+            account id or token changes.
         """
-        return {
-            'accountID': self.account_id,
-            'token': self.token
-        }
+        cache_key = (self.account_id, self.token)
+        if self._req_body_auth is None or self._req_body_auth_key != cache_key:
+            self._req_body_auth = {
+                'accountID': self.account_id,
+                'token': self.token
+            }
+            self._req_body_auth_key = cache_key
+        return self._req_body_auth
 
     def req_body_login(self) -> REQUEST_T:
         """Return the body for the login request."""
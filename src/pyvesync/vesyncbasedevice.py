@@ -223,9 +223,15 @@ class VeSyncBaseDevice:
         for line in disp:
             print(f"{line[0]+': ':.<30} {line[1]}")
 
-    def displayJSON(self) -> str:
+    def displayJSON(self, pretty: bool = False) -> str:
         """JSON API for device details.
 
+        Defaults to compact output for machine consumers; pass
+        `pretty=True` for indented output.
+
+        Parameters:
+            pretty (bool): Indent the output with 4 spaces.
+
         Returns:
             str: JSON formatted string of device details.
 
@@ -242,17 +248,25 @@ class VeSyncBaseDevice:
         }
         ```
         """
-        return json.dumps(
-            {
-                'Device Name': self.device_name,
-                'Model': self.device_type,
-                'Subdevice No': str(self.sub_device_no),
-                'Status': self.device_status,
-                'Online': self.connection_status,
-                'Type': self.type,
-                'CID': self.cid,
-            },
-            indent=4)
+        if pretty:
+            return json.dumps(self._display_dict(), indent=4)
+        return json.dumps(self._display_dict(), separators=(',', ':'))
+
+    def _display_dict(self) -> dict:
+        """Build the details dict serialized by `displayJSON`.
+
+        Subclasses extend the returned dict instead of re-parsing the
+        serialized output of `displayJSON`.
+        """
+        return {
+            'Device Name': self.device_name,
+            'Model': self.device_type,
+            'Subdevice No': str(self.sub_device_no),
+            'Status': self.device_status,
+            'Online': self.connection_status,
+            'Type': self.type,
+            'CID': self.cid,
+        }
 
     def update(self) -> None:
         """Update device details."""
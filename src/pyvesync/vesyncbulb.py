@@ -489,11 +489,11 @@ class VeSyncBulb(VeSyncBaseDevice):
                 for line in disp:
                     print(f"{line[0]+': ':.<30} {' '.join([str(ln) for ln in line[1:]])}")
 
-    def displayJSON(self) -> str:
-        """Return bulb device info in JSON format.
+    def _display_dict(self) -> dict:
+        """Return bulb device info for JSON output.
 
         Returns:
-            str: JSON formatted string of bulb details.
+            dict: Dictionary of bulb details.
 
         Example:
             ```json
@@ -510,8 +510,7 @@ class VeSyncBulb(VeSyncBaseDevice):
             }
             ```
         """
-        sup = super().displayJSON()
-        sup_val = json.loads(sup)
+        sup_val = super()._display_dict()
         if self.connection_status == 'online':
             if self.dimmable_feature:
                 sup_val.update({'Brightness': str(self.brightness)})
@@ -526,7 +525,7 @@ class VeSyncBulb(VeSyncBaseDevice):
                 if self.color_rgb is not None:
                     sup_val.update({'ColorRGB': json.dumps(self.color_rgb._asdict())})
                 sup_val.update({'ColorMode': str(self.color_mode)})
-        return json.dumps(sup_val, indent=4)
+        return sup_val
 
     @property
     def color_value_rgb(self) -> NamedTuple | None:
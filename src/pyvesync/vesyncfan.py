@@ -874,14 +874,13 @@ class VeSyncAirBypass(VeSyncAir):
         for line in disp:
             print(f"{line[0]+': ':.<30} {' '.join(line[1:])}")
 
-    def displayJSON(self) -> str:
+    def _display_dict(self) -> dict:
         """Return air purifier status and properties in JSON output.
 
         Returns:
-            str : JSON formatted string of air purifier details
+            dict : Dictionary of air purifier details
         """
-        sup = super().displayJSON()
-        sup_val = json.loads(sup)
+        sup_val = super()._display_dict()
         sup_val.update(
             {
                 'Mode': self.mode,
@@ -901,7 +900,7 @@ class VeSyncAirBypass(VeSyncAir):
             sup_val.update(
                 {'Air Quality Value': str(self.details.get('air_quality_value', ''))}
             )
-        return json.dumps(sup_val, indent=4)
+        return sup_val
 
 
 class VeSyncAirBaseV2(VeSyncAirBypass):
@@ -1284,14 +1283,13 @@ class VeSyncAirBaseV2(VeSyncAirBypass):
         _LOGGER.debug('Error setting purifier mode')
         return False
 
-    def displayJSON(self) -> str:
+    def _display_dict(self) -> dict:
         """Return air purifier status and properties in JSON output.
 
         Returns:
-            str : JSON formatted string of air purifier details
+            dict : Dictionary of air purifier details
         """
-        sup = super().displayJSON()
-        sup_val = json.loads(sup)
+        sup_val = super()._display_dict()
         sup_val.update(
             {
                 'Mode': self.mode,
@@ -1321,7 +1319,7 @@ class VeSyncAirBaseV2(VeSyncAirBypass):
         for key, value in everest_keys.items():
             if key in self.details:
                 sup_val.update({value: str(self.details[key])})
-        return json.dumps(sup_val, indent=4)
+        return sup_val
 
 
 class VeSyncTowerFan(VeSyncAirBaseV2):
@@ -1611,10 +1609,9 @@ class VeSyncAir131(VeSyncAir):
         for line in disp:
             print(f"{line[0]+': ':.<30} {' '.join([str(ln) for ln in line[1:]])}")
 
-    def displayJSON(self) -> str:
+    def _display_dict(self) -> dict:
         """Return air purifier status and properties in JSON output."""
-        sup = super().displayJSON()
-        sup_val = json.loads(sup)
+        sup_val = super()._display_dict()
         sup_val.update(
             {
                 'Active Time': str(self.active_time),
@@ -1625,7 +1622,7 @@ class VeSyncAir131(VeSyncAir):
                 'Filter Life': str(self.filter_life)
             }
         )
-        return json.dumps(sup_val, indent=4)
+        return sup_val
 
 
 class VeSyncHumidifier(VeSyncFan):
@@ -1997,10 +1994,9 @@ class VeSyncHumid200300S(VeSyncHumidifier):
         for line in disp:
             print(f"{line[0] + ': ':.<30} {' '.join(line[1:])}")
 
-    def displayJSON(self) -> str:
+    def _display_dict(self) -> dict:
         """Return air purifier status and properties in JSON output."""
-        sup = super().displayJSON()
-        sup_val = json.loads(sup)
+        sup_val = super()._display_dict()
         sup_val.update(
             {
                 'Mode': self.details['mode'],
@@ -2025,7 +2021,7 @@ class VeSyncHumid200300S(VeSyncHumidifier):
         if self.warm_mist_feature:
             sup_val['Warm mist enabled'] = self.details['warm_mist_enabled']
             sup_val['Warm mist level'] = self.details['warm_mist_level']
-        return json.dumps(sup_val, indent=4)
+        return sup_val
 
 
 class VeSyncHumid200S(VeSyncHumid200300S):
@@ -2363,10 +2359,9 @@ class VeSyncSuperior6000S(VeSyncHumidifier):
         for line in disp:
             print(f"{line[0]+': ':.<30} {' '.join(line[1:])}")
 
-    def displayJSON(self) -> str:
+    def _display_dict(self) -> dict:
         """Return air purifier status and properties in JSON output."""
-        sup = super().displayJSON()
-        sup_val = json.loads(sup)
+        sup_val = super()._display_dict()
         sup_val.update(
             {
                 'Temperature': self.temperature,
@@ -2385,7 +2380,7 @@ class VeSyncSuperior6000S(VeSyncHumidifier):
                 'Drying Mode Time Remaining': self.drying_mode_seconds_remaining,
             }
         )
-        return json.dumps(sup_val, indent=4)
+        return sup_val
 
 
 class VeSyncHumid1000S(VeSyncHumid200300S):
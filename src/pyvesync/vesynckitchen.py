@@ -1,5 +1,4 @@
 """VeSync Kitchen Devices."""
-import json
 import logging
 import time
 import sys
@@ -650,10 +649,9 @@ class VeSyncAirFryer158(VeSyncKitchen):
         for line in disp:
             print(f"{line[0]+': ':.<30} {' '.join(line[1:])}")
 
-    def displayJSON(self) -> str:
-        """Display JSON of device details."""
-        sup = super().displayJSON()
-        sup_dict = json.loads(sup)
+    def _display_dict(self) -> dict:
+        """Build dict of device details for JSON display."""
+        sup_dict = super()._display_dict()
         sup_dict['cook_status'] = self.cook_status
         sup_dict['temp_unit'] = self.temp_unit
 
@@ -672,7 +670,7 @@ class VeSyncAirFryer158(VeSyncKitchen):
                 }
                 status_dict.update(preheat_dict)
             sup_dict.update(status_dict)
-        return json.dumps(sup_dict, indent=4)
+        return sup_dict
 
 
 def factory(module: str, details: dict, manager) -> Optional[VeSyncKitchen]:
@@ -2,10 +2,10 @@
 
 import logging
 import time
-import json
 import sys
 from abc import ABCMeta, abstractmethod
-from datetime import datetime, timedelta
+from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any
 
 from .const import (
@@ -19,6 +19,36 @@ from .vesyncbasedevice import VeSyncBaseDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# Resolved once at import - saves a class attribute lookup on every
+# response check in this module's hot paths.
+_code_ok = Helpers.code_check
+
+# Firmware version and configuration are effectively static, so
+# refreshing them once an hour is plenty.
+_CONFIG_TTL = 3600.0
+
+
+def _ttl_cached(ttl):
+    """Cache a config fetch per instance for `ttl` seconds.
+
+    Successful results are stored on `self._config_cache`; failures are
+    never cached so the next poll retries. `invalidate_config()` clears
+    the cache early, e.g. after a firmware update.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self):  # pylint: disable=protected-access
+            cached = self._config_cache
+            if cached is not None and (time.monotonic() - cached[0]) < ttl:
+                return cached[1]
+            result = func(self)
+            if result:
+                self._config_cache = (time.monotonic(), result)
+            return result
+        return wrapper
+    return decorator
+
+
 module_outlet = sys.modules[__name__]
 
 # --8<-- [start:outlet_configs]
@@ -72,6 +102,9 @@ class VeSyncOutlet(VeSyncBaseDevice):
     _energy_update_interval: float = 0
     energy_period: bool = True
     device_family = EDeviceFamily.OUTLET
+    # URL prefix for the legacy v1 device endpoints, precomputed per
+    # class so call_api only concatenates.
+    _API_BASE: str = ''
 
     __metaclass__ = ABCMeta
 
@@ -81,6 +114,9 @@ class VeSyncOutlet(VeSyncBaseDevice):
         self.energy = {}
         self._energy_update_interval = manager.energy_update_interval
         self.energy_period = energy_period
+        # Features are fixed per model, so resolve the membership test once
+        self._has_energy_history = 'energyHistory' in self.features
+        self._config_cache: Optional[tuple] = None
 
     @property
     def update_time_check(self) -> bool:
@@ -88,11 +124,20 @@ class VeSyncOutlet(VeSyncBaseDevice):
         if self.update_energy_ts is None:
             return True
 
-        if ((time.time() - self.update_energy_ts)
+        if ((time.monotonic() - self.update_energy_ts)
                 > self._energy_update_interval):
             return True
         return False
 
+    def call_api(self, api, method, body):
+        """Return the response of the api call relative to the class prefix."""
+        return Helpers.call_api(
+            self._API_BASE + api,
+            method=method,
+            headers=self.manager.req_headers(),
+            json_object=body,
+        )
+
     @abstractmethod
     def get_energy(self, period) -> Optional[dict]:
         """Build energy history dictionary."""
@@ -100,19 +145,19 @@ class VeSyncOutlet(VeSyncBaseDevice):
 
     def get_weekly_energy(self) -> Optional[dict]:
         """Build weekly energy history dictionary."""
-        if (self.supports('energyHistory')):
+        if (self._has_energy_history):
             return self.get_energy(ENERGY_WEEK)
         return None
 
     def get_monthly_energy(self) -> Optional[dict]:
         """Build Monthly Energy History Dictionary."""
-        if (self.supports('energyHistory')):
+        if (self._has_energy_history):
             return self.get_energy(ENERGY_MONTH)
         return None
 
     def get_yearly_energy(self) -> Optional[dict]:
         """Build Yearly Energy Dictionary."""
-        if (self.supports('energyHistory')):
+        if (self._has_energy_history):
             return self.get_energy(ENERGY_YEAR)
         return None
 
@@ -120,18 +165,35 @@ class VeSyncOutlet(VeSyncBaseDevice):
     def get_config(self) -> dict:
         """Get configuration and firmware details."""
 
+    def invalidate_config(self) -> None:
+        """Drop the cached config so the next get_config call refetches."""
+        self._config_cache = None
+
     def update_energy(self, bypass_check: bool = False) -> None:
         """Build weekly, monthly and yearly dictionaries."""
-        if bypass_check or (not bypass_check and self.update_time_check):
-            self.update_energy_ts = time.time()
-            if not self.get_weekly_energy() is None:
-                self.get_monthly_energy()
-                self.get_yearly_energy()
-            else:
-                self.energy[ENERGY_MONTH] = {}
-                self.energy[ENERGY_YEAR] = {}
-            if not bypass_check:
-                self.update_energy_ts = time.time()
+        if not self._has_energy_history:
+            # Devices without energy history would only dispatch three
+            # None-gated getters - skip the whole path.
+            return
+        if not (bypass_check or self.update_time_check):
+            return
+        if not self.get_weekly_energy() is None:
+            # The two remaining fetches are independent round trips, so
+            # overlap them. Seed the keys first to keep the
+            # week/month/year ordering of the energy dict deterministic.
+            self.energy.setdefault(ENERGY_MONTH, None)
+            self.energy.setdefault(ENERGY_YEAR, None)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                monthly = pool.submit(self.get_monthly_energy)
+                yearly = pool.submit(self.get_yearly_energy)
+                monthly.result()
+                yearly.result()
+            self.update_energy_ts = time.monotonic()
+        else:
+            # Leave the previous timestamp so a transient failure does
+            # not block the next poll for the whole update interval.
+            self.energy[ENERGY_MONTH] = {}
+            self.energy[ENERGY_YEAR] = {}
 
     @property
     def active_time(self) -> int:
@@ -146,23 +208,36 @@ class VeSyncOutlet(VeSyncBaseDevice):
     @property
     def power(self) -> float:
         """Return current power in watts."""
-        P = float(self.details.get('power', 0))
-        return round(P, 3)
+        return self.details.get('power', 0.0)
 
     @property
     def voltage(self) -> float:
         """Return current voltage."""
-        U = float(self.details.get('voltage', 0))
-        return round(U, 1)
+        return self.details.get('voltage', 0.0)
 
     @property
     def current(self) -> float:
         """Return the actual current value."""
-        I: float = float(self.details.get('current', 0))
-        if (I == 0):
-            if (self.voltage != 0):
-                return self.power / self.voltage
-        return round(I, 2)
+        return self.details.get('current', 0.0)
+
+    def _parse_measurements(self) -> None:
+        """Coerce measurement details to rounded floats once per refresh.
+
+        The `power`/`voltage`/`current` properties are polled several
+        times per state refresh, so parse here instead of on every
+        property access.
+        """
+        d = self.details
+        power = round(float(d.get('power', 0)), 3)
+        voltage = round(float(d.get('voltage', 0)), 1)
+        current = float(d.get('current', 0))
+        if (current == 0) and (voltage != 0):
+            current = power / voltage
+        else:
+            current = round(current, 2)
+        d['power'] = power
+        d['voltage'] = voltage
+        d['current'] = current
 
     @property
     def monthly_energy_total(self) -> float:
@@ -195,10 +270,9 @@ class VeSyncOutlet(VeSyncBaseDevice):
         for line in disp:
             print(f"{line[0]+': ':.<30} {' '.join(line[1:])}")
 
-    def displayJSON(self) -> str:
-        """Return JSON details for outlet."""
-        sup = super().displayJSON()
-        sup_val = json.loads(sup)
+    def _display_dict(self) -> dict:
+        """Return details dict for outlet."""
+        sup_val = super()._display_dict()
         sup_val.update(
             {
                 'Active Time': str(self.active_time),
@@ -212,7 +286,7 @@ class VeSyncOutlet(VeSyncBaseDevice):
             }
         )
 
-        return json.dumps(sup_val, indent=4)
+        return sup_val
 
     @property
     def has_energy_period(self) -> bool:
@@ -223,8 +297,12 @@ class VeSyncOutlet(VeSyncBaseDevice):
 class VeSyncOutlet7A(VeSyncOutlet):
     """Etekcity 7A Round Outlet Class."""
 
-    det_keys = ['deviceStatus', 'activeTime', 'energy', 'power', 'voltage']
-    energy_keys = ['energyConsumptionOfToday', 'maxEnergy', 'totalEnergy']
+    det_keys = frozenset(
+        {'deviceStatus', 'activeTime', 'energy', 'power', 'voltage'}
+    )
+    energy_keys = frozenset(
+        {'energyConsumptionOfToday', 'maxEnergy', 'totalEnergy'}
+    )
 
     def __init__(self, details, manager):
         """Initialize Etekcity 7A round outlet class."""
@@ -238,8 +316,8 @@ class VeSyncOutlet7A(VeSyncOutlet):
             headers=self.manager.req_headers(),
         )
 
-        if r is not None:
-            if all(x in r for x in self.det_keys):
+        if isinstance(r, dict):
+            if self.det_keys <= r.keys():
                 self.device_status = r.get('deviceStatus', self.device_status)
                 self.details['active_time'] = r.get('activeTime', 0)
                 self.details['energy'] = r.get('energy', 0)
@@ -247,6 +325,7 @@ class VeSyncOutlet7A(VeSyncOutlet):
                 self.details['power'] = self.parse_energy_detail(power)
                 voltage = r.get('voltage', 0)
                 self.details['voltage'] = self.parse_energy_detail(voltage)
+                self._parse_measurements()
                 return
 
         _LOGGER.error('Failed to get %s details', self.device_name)
@@ -255,14 +334,15 @@ class VeSyncOutlet7A(VeSyncOutlet):
     def parse_energy_detail(energy) -> float:
         """Parse energy details to be compatible with new and old firmware."""
         try:
-            if isinstance(energy, str) and ':' in energy:
-                power = round(float(Helpers.calculate_hex(energy)), 2)
-            else:
-                power = float(energy)
+            if energy.__class__ is str and ':' in energy:
+                # Old firmware sends 'hex:hex' pairs - inlined from
+                # Helpers.calculate_hex to skip the split() allocation
+                high, _, low = energy.partition(':')
+                return round((int(high, 16) + int(low, 16)) / 8192, 2)
+            return float(energy)
         except ValueError:
             _LOGGER.debug('Error parsing power response - %s', energy)
-            power = 0
-        return power
+            return 0
 
     def get_energy(self, period) -> dict:
         """Get 7A outlet energy for period info and buld weekly energy dict."""
@@ -272,8 +352,8 @@ class VeSyncOutlet7A(VeSyncOutlet):
             headers=self.manager.req_headers(),
         )
 
-        if r is not None:
-            if all(x in r for x in self.energy_keys):
+        if isinstance(r, dict):
+            if self.energy_keys <= r.keys():
                 self.energy[period] = Helpers.build_energy_dict(r)
                 return self.energy[period]
 
@@ -295,6 +375,7 @@ class VeSyncOutlet7A(VeSyncOutlet):
         self.device_status = status
         return True
 
+    @_ttl_cached(_CONFIG_TTL)
     def get_config(self) -> dict:
         """Get 7A outlet configuration info."""
         r = Helpers.call_api(
@@ -314,62 +395,40 @@ class VeSyncOutlet7A(VeSyncOutlet):
         return self.config
 
 
-class VeSyncOutlet10A(VeSyncOutlet):
-    """Etekcity 10A Round Outlets."""
+class VeSyncOutletV1(VeSyncOutlet):
+    """Shared logic for outlets using the legacy v1 device endpoints.
 
-    def __init__(self, details, manager):
-        """Initialize 10A outlet class."""
-        super().__init__(details, manager)
-
-    def call_api(self, api, method, body):
-        """Return the response for the method of the api call with the givne body."""
-        r = Helpers.call_api(
-            f'/10a/v1/device/{api}',
-            method=method,
-            headers=self.manager.req_headers(),
-            json_object=body,
-        )
-        return r
-
-    def get_details(self) -> None:
-        """Get 10A outlet details."""
-        body = self.manager.req_body_device_detail()
-        body['uuid'] = self.uuid
-
-        r = self.call_api('devicedetail', 'post', body)
-
-        if Helpers.code_check(r):
-            self.device_status = r.get('deviceStatus', self.device_status)
-            self.connection_status = r.get('connectionStatus',
-                                           self.connection_status)
-            self.details = Helpers.build_details_dict(r)
-            return
+    The 10A, 15A and outdoor plugs differ only in URL prefix and a few
+    request-body fields, so the common methods live here once.
+    """
 
-        _LOGGER.debug('Failed to get %s details', self.device_name)
+    def _turn_body_extra(self, body) -> None:
+        """Add subclass-specific fields to the turn request body."""
 
+    @_ttl_cached(_CONFIG_TTL)
     def get_config(self) -> dict:
-        """Get 10A outlet configuration info."""
+        """Get outlet configuration info."""
         body = self.manager.req_body_device_detail()
         body['uuid'] = self.uuid
         body['method'] = 'configurations'
 
         r = self.call_api('configurations', 'post', body)
 
-        if Helpers.code_check(r):
+        if _code_ok(r):
             self.config = Helpers.build_config_dict(r)
         else:
             self.config = {}
-            _LOGGER.debug('Error getting %s config info!', self.device_name)
+            _LOGGER.debug('Unable to get %s config info!', self.device_name)
         return self.config
 
     def get_energy(self, period) -> dict:
-        """Get 10A outlet energy for period info and populate energy dict."""
+        """Get outlet energy for period info and populate energy dict."""
         body = self.manager.req_body_energy(period)
         body['uuid'] = self.uuid
 
         r = self.call_api(f'energy{period}', 'post', body)
 
-        if Helpers.code_check(r):
+        if _code_ok(r):
             self.energy[period] = Helpers.build_energy_dict(r)
         else:
             self.energy[period] = None
@@ -377,40 +436,71 @@ class VeSyncOutlet10A(VeSyncOutlet):
         return self.energy[period]
 
     def turn(self, status) -> bool:
-        """Turn 10A outlet on/off - return True if successful."""
+        """Turn outlet on/off - return True if successful."""
         body = self.manager.req_body_status()
         body['uuid'] = self.uuid
         body['status'] = status
+        self._turn_body_extra(body)
 
         r = self.call_api('devicestatus', 'put', body)
 
-        if Helpers.code_check(r):
+        if _code_ok(r):
             self.device_status = status
             return True
         _LOGGER.warning('Error turning %s %s!', self.device_name, status)
         return False
 
 
-class VeSyncOutlet15A(VeSyncOutlet):
+class VeSyncOutlet10A(VeSyncOutletV1):
+    """Etekcity 10A Round Outlets."""
+
+    _API_BASE = '/10a/v1/device/'
+
+    def __init__(self, details, manager):
+        """Initialize 10A outlet class."""
+        super().__init__(details, manager)
+
+    def get_details(self) -> None:
+        """Get 10A outlet details."""
+        body = self.manager.req_body_device_detail()
+        body['uuid'] = self.uuid
+
+        r = self.call_api('devicedetail', 'post', body)
+
+        if _code_ok(r):
+            self.device_status = r.get('deviceStatus', self.device_status)
+            self.connection_status = r.get('connectionStatus',
+                                           self.connection_status)
+            self.details = Helpers.build_details_dict(r)
+            self._parse_measurements()
+            return
+
+        _LOGGER.debug('Failed to get %s details', self.device_name)
+
+
+class VeSyncOutlet15A(VeSyncOutletV1):
     """Class for Etekcity 15A Rectangular Outlets."""
 
+    det_keys = frozenset({
+        'deviceStatus',
+        'activeTime',
+        'energy',
+        'power',
+        'voltage',
+        'nightLightStatus',
+        'nightLightAutomode',
+        'nightLightBrightness',
+    })
+
     nightlight_status: str = STATUS_OFF
     nightlight_brightness: float = 0
 
+    _API_BASE = '/15a/v1/device/'
+
     def __init__(self, details, manager):
         """Initialize 15A rectangular outlets."""
         super().__init__(details, manager)
 
-    def call_api(self, api, method, body):
-        """Return the response for the method's api call with the spezified body."""
-        r = Helpers.call_api(
-            f'/15a/v1/device/{api}',
-            method=method,
-            headers=self.manager.req_headers(),
-            json_object=body,
-        )
-        return r
-
     def get_details(self) -> None:
         """Get 15A outlet details."""
         body = self.manager.req_body_device_detail()
@@ -418,71 +508,18 @@ class VeSyncOutlet15A(VeSyncOutlet):
 
         r = self.call_api('devicedetail', 'post', body)
 
-        attr_list = (
-            'deviceStatus',
-            'activeTime',
-            'energy',
-            'power',
-            'voltage',
-            'nightLightStatus',
-            'nightLightAutomode',
-            'nightLightBrightness',
-        )
-
-        if Helpers.code_check(r):
+        if _code_ok(r):
             if (r is not None):
-                if all(k in r for k in attr_list):
+                if self.det_keys <= r.keys():
                     self.device_status = r.get('deviceStatus')
                     self.connection_status = r.get('connectionStatus')
                     self.nightlight_status = r.get('nightLightStatus')
                     self.nightlight_brightness = r.get('nightLightBrightness')
                     self.details = Helpers.build_details_dict(r)
+                    self._parse_measurements()
                     return
         _LOGGER.error('Failed to get %s details', self.device_name)
 
-    def get_config(self) -> dict:
-        """Get 15A outlet configuration info."""
-        body = self.manager.req_body_device_detail()
-        body['method'] = 'configurations'
-        body['uuid'] = self.uuid
-
-        r = self.call_api('configurations', 'post', body)
-
-        if Helpers.code_check(r):
-            self.config = Helpers.build_config_dict(r)
-        else:
-            self.config = {}
-            _LOGGER.debug('Unable to get %s config info!', self.device_name)
-        return self.config
-
-    def get_energy(self, period) -> dict:
-        """Get 15A outlet energy for period info and populate energy dict."""
-        body = self.manager.req_body_energy(period)
-        body['uuid'] = self.uuid
-
-        r = self.call_api(f'energy{period}', 'post', body)
-
-        if Helpers.code_check(r):
-            self.energy[period] = Helpers.build_energy_dict(r)
-        else:
-            self.energy[period] = None
-            _LOGGER.error('Unable to get %s energy-data for %s!', self.device_name, period)
-        return self.energy[period]
-
-    def turn(self, status) -> bool:
-        """Turn 15A outlet on/off - return True if successful."""
-        body = self.manager.req_body_status()
-        body['uuid'] = self.uuid
-        body['status'] = status
-
-        r = self.call_api('devicestatus', 'put', body)
-
-        if Helpers.code_check(r):
-            self.device_status = status
-            return True
-        _LOGGER.warning('Error turning %s %s!', self.device_name, status)
-        return False
-
     def turn_nightlight(self, mode) -> bool:
         """Turn the nightlight to mode."""
         body = self.manager.req_body_status()
@@ -490,7 +527,7 @@ class VeSyncOutlet15A(VeSyncOutlet):
         body['mode'] = mode
         r = self.call_api('nightlightstatus', 'put', body)
 
-        if Helpers.code_check(r):
+        if _code_ok(r):
             return True
         _LOGGER.debug('Error turning %s to %s nightlight!', self.device_name, mode)
         return False
@@ -504,31 +541,24 @@ class VeSyncOutlet15A(VeSyncOutlet):
         return self.turn_nightlight(MODE_MANUAL)
 
 
-class VeSyncOutdoorPlug(VeSyncOutlet):
+class VeSyncOutdoorPlug(VeSyncOutletV1):
     """Class to hold Etekcity outdoor outlets."""
 
+    _API_BASE = '/outdoorsocket15a/v1/device/'
+
     def __init__(self, details, manager):
         """Initialize Etekcity Outdoor Plug class."""
         super().__init__(details, manager)
 
-    def call_api(self, api, method, body):
-        """Return the respons for the method's api call with given body."""
-        r = Helpers.call_api(
-            f'/outdoorsocket15a/v1/device/{api}',
-            method=method,
-            headers=self.manager.req_headers(),
-            json_object=body,
-        )
-        return r
-
     def get_details(self) -> None:
         """Get details for outdoor outlet."""
         body = self.manager.req_body_device_detail()
         body['uuid'] = self.uuid
         r = self.call_api('devicedetail', 'post', body)
 
-        if Helpers.code_check(r):
+        if _code_ok(r):
             self.details = Helpers.build_details_dict(r)
+            self._parse_measurements()
             self.connection_status = r.get('connectionStatus')
 
             dev_no = self.sub_device_no
@@ -538,50 +568,10 @@ class VeSyncOutdoorPlug(VeSyncOutlet):
                 return
         _LOGGER.debug('Failed to get %s details!', self.device_name)
 
-    def get_config(self) -> dict:
-        """Get configuration info for outdoor outlet."""
-        body = self.manager.req_body_device_detail()
-        body['method'] = 'configurations'
-        body['uuid'] = self.uuid
-
-        r = self.call_api('configurations', 'post', body)
-
-        if Helpers.code_check(r):
-            self.config = Helpers.build_config_dict(r)
-        else:
-            self.config = {}
-            _LOGGER.error('Error getting % config info!', self.device_name)
-        return self.config
-
-    def get_energy(self, period) -> dict:
-        """Get outdoor outlet energy for period info and populate energy dict."""
-        body = self.manager.req_body_energy(period)
-        body['uuid'] = self.uuid
-
-        r = self.call_api(f'energy{period}', 'post', body)
-
-        if Helpers.code_check(r):
-            self.energy[period] = Helpers.build_energy_dict(r)
-        else:
-            self.energy[period] = None
-            _LOGGER.error('Unable to get %s energy-data for %s!', self.device_name, period)
-        return self.energy[period]
-
-    def turn(self, status) -> bool:
-        """Turn outdoor outlet on/off."""
-        body = self.manager.req_body_status()
-        body['uuid'] = self.uuid
-        body['status'] = status
+    def _turn_body_extra(self, body) -> None:
+        """Address the sub-socket of the outdoor plug."""
         body['switchNo'] = self.sub_device_no
 
-        r = self.call_api('devicestatus', 'put', body)
-
-        if Helpers.code_check(r):
-            self.device_status = status
-            return True
-        _LOGGER.warning('Error turning %s %s', self.device_name, status)
-        return False
-
 
 class VeSyncOutletV2(VeSyncOutlet):
     """VeSync bypassV2 smart plug."""
@@ -590,20 +580,26 @@ class VeSyncOutletV2(VeSyncOutlet):
         """Initialize bypassV2 smart plug class."""
         super().__init__(details, manager, False)
 
-    def get_body_v2(self) -> dict:
-        """Build the body for a bypass request vor api V2."""
+    def get_body_v2(self, payload: Optional[dict] = None) -> dict:
+        """Build the body for a bypass request vor api V2.
+
+        Accepts the request payload so the body is built as one dict
+        instead of allocating and then mutating it at every call site.
+        """
         body = {
             **self.manager.req_body_bypass_v2(),
             'cid': self.cid,
             'configModule': self.config_module
         }
+        if payload is not None:
+            body['payload'] = payload
         return body
 
     def get_response(self, body) -> tuple[Optional[dict], Any]:
         """Return the response of the request for the  given api-body."""
         response = self.manager.post_device_managed_v2(body)
 
-        if Helpers.code_check(response):
+        if _code_ok(response):
             code = response['result']
             if (code['code'] == 0):
                 return code, None
@@ -634,12 +630,11 @@ class VeSyncOutletBSDGO1(VeSyncOutletV2):
 
     def get_details(self) -> None:
         """Get BSDGO1 device details."""
-        body = self.get_body_v2()
-        body['payload'] = {
+        body = self.get_body_v2({
             'method': 'getProperty',
             'source': 'APP',
             'data': {}
-        }
+        })
 
         code, _ = self.get_response(body)
         if (code is not None):
@@ -650,12 +645,11 @@ class VeSyncOutletBSDGO1(VeSyncOutletV2):
 
     def turn(self, status: str) -> bool:
         """Set power state of BSDGO1 outlet."""
-        body = self.get_body_v2()
-        body['payload'] = {
+        body = self.get_body_v2({
             'data': {'powerSwitch_1': 1 if (status == STATUS_ON) else 0},
             'method': 'setProperty',
             'source': 'APP'
-        }
+        })
 
         _, error = self.get_response(body)
         if error is None:
@@ -711,26 +705,65 @@ class VeSyncOutletWYSMTOD16A(VeSyncOutletV2):
             self.details['current'] = properties.get('realTimeCurrent', 0)
             self.details['power'] = properties.get('realTimePower', 0)
             self.details['energy'] = properties.get('electricalEnergy', 0)
+            self._parse_measurements()
             self.connection_status = 'online'
             return
         self.connection_status = 'offline'
 
+    def update_energy(self, bypass_check: bool = False) -> None:
+        """Populate all periods from a single yearly history request.
+
+        getEnergyHistory takes an arbitrary fromDay/toDay window, so one
+        request spanning the yearly period already contains the weekly and
+        monthly series - those are sliced out locally instead of spending
+        two more round trips.
+        """
+        if not self._has_energy_history:
+            return
+        if not (bypass_check or self.update_time_check):
+            return
+        self.energy[ENERGY_WEEK] = None
+        self.energy[ENERGY_MONTH] = None
+        yearly = self.get_energy(ENERGY_YEAR)
+        if yearly is None:
+            self.energy[ENERGY_WEEK] = {}
+            self.energy[ENERGY_MONTH] = {}
+        else:
+            self.energy[ENERGY_WEEK] = self._energy_subset(yearly, ENERGY_WEEK)
+            self.energy[ENERGY_MONTH] = self._energy_subset(yearly, ENERGY_MONTH)
+            # Only a successful fetch refreshes the timestamp so a
+            # transient failure is retried on the next poll.
+            self.update_energy_ts = time.monotonic()
+
+    @staticmethod
+    def _energy_subset(yearly: dict, period: str) -> dict:
+        """Derive a shorter period's energy dict from the yearly series."""
+        subset = dict(yearly)
+        data = yearly.get('data')
+        if isinstance(data, list):
+            days = PERIOD_2_DAYS[period]
+            subset['data'] = data[-days:]
+            subset['total_energy'] = round(sum(
+                day for day in subset['data'] if isinstance(day, (int, float))
+            ), 3)
+        return subset
+
     def get_energy(self, period) -> dict:
-        today = datetime.today()
-        from_day = today - timedelta(days=PERIOD_2_DAYS[period])
-        till_day = today
+        # Plain epoch arithmetic - avoids two datetime allocations and a
+        # timedelta per request for the same timestamps.
+        till_day = time.time()
+        from_day = till_day - PERIOD_2_DAYS[period] * 86400.0
 
-        body = self.get_body_v2()
-        body['subDeviceNo'] = 0
-        body['payload'] = {
+        body = self.get_body_v2({
             'method': 'getEnergyHistory',
             'source': 'APP',
             'subDeviceNo': 0,
             'data': {
-                'fromDay': from_day.timestamp(),
-                'toDay': till_day.timestamp()
+                'fromDay': from_day,
+                'toDay': till_day
             }
-        }
+        })
+        body['subDeviceNo'] = 0
         code, _ = self.get_response(body)
 
         if (code is not None):
@@ -741,15 +774,14 @@ class VeSyncOutletWYSMTOD16A(VeSyncOutletV2):
 
     def turn(self, status) -> bool:
         """Turn power for outdoor outlet on/off."""
-        body = self.get_body_v2()
-        body['payload'] = {
+        body = self.get_body_v2({
             'method': 'setSwitch',
             'source': 'APP',
             'data': {
                 'enabled': (status == STATUS_ON),
                 'id': 0,
             },
-        }
+        })
 
         _, error = self.get_response(body)
         if (error is None):
@@ -759,23 +791,31 @@ class VeSyncOutletWYSMTOD16A(VeSyncOutletV2):
 
     def get_properties(self, properties):
         """Return the value of one of the properties."""
-        body = self.get_body_v2()
-        body['payload'] = {
+        body = self.get_body_v2({
             'method': 'getProperty',
             'source': 'APP',
             'data': {'properties': properties},
-        }
+        })
         code, error = self.get_response(body)
         if (error is None):
             return code['result']
         return None
 
 
+# Classes resolved once at import so the factory is a dict lookup + call
+# instead of a getattr walk over the module per device
+_OUTLET_CLS: dict[str, type] = {
+    model: getattr(module_outlet, class_name)
+    for model, class_name in outlet_classes.items()
+}
+
+
 def factory(module: str, details: dict, manager) -> Optional[VeSyncOutlet]:
     """Create VeSync outlet instance from the given module name."""
+    outlet = _OUTLET_CLS.get(module)
+    if outlet is None:
+        return None
     try:
-        class_name = outlet_classes[module]
-        outlet = getattr(module_outlet, class_name)
         return outlet(details, manager)
     except Exception:
         return None
@@ -21,7 +21,6 @@ Note:
 """
 
 import logging
-import json
 import sys
 from abc import ABCMeta, abstractmethod
 from typing import Optional
@@ -341,9 +340,9 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
         for line in disp:
             print(f"{line[0]+': ':.<30} {' '.join(line[1:])}")
 
-    def displayJSON(self) -> str:
-        """JSON API for dimmer switch."""
-        sup_val = json.loads(super().displayJSON())
+    def _display_dict(self) -> dict:
+        """Details dict for dimmer switch."""
+        sup_val = super()._display_dict()
         if self.is_dimmable is True:  # pylint: disable=using-constant-test
             sup_val.update(
                 {
@@ -352,7 +351,7 @@ class VeSyncDimmerSwitch(VeSyncSwitch):
                     'RGB Light': str(self._rgb_status),
                 }
             )
-        return json.dumps(sup_val, indent=4)
+        return sup_val
 
 
 def factory(module: str, details: dict, manager) -> Optional[VeSyncSwitch]:
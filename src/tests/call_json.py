@@ -1,4 +1,5 @@
 import copy
+import functools
 
 from pyvesync.const import *
 
@@ -164,7 +165,27 @@ class DeviceList:
     switches = dict.fromkeys(call_json_switches.SWITCHES, "Switches")
 
     @classmethod
-    def device_list_item(cls, model, sub_device_no=0):
+    def build_list_response(cls, *items):
+        """Assemble a device list response holding the given list items.
+
+        Built from flat dict literals, so no deepcopy of the response
+        template is needed.
+        """
+        return {
+            'code': 0,
+            'msg': 'Success',
+            'result': {
+                'pageNo': 1,
+                'pageSize': 100,
+                'total': len(items),
+                'list': list(items),
+            }
+        }
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _device_list_item_template(cls, model, sub_device_no=0):
+        """Assemble a device list item once per model."""
         model_types = {**cls.bulbs, **cls.outlets, **cls.fans, **cls.switches}
 
         device_dict = cls.device_list_base
@@ -180,20 +201,18 @@ class DeviceList:
         return model_dict
 
     @classmethod
-    def device_list_response(cls, device_types=None, _types=None):
-        """Class method that returns the api get_devices response
-
-        Args:
-            _types (list, str, optional): Can be one or list of types of devices.
-                Defaults to None. can be bulb, fans, switches, outlets in list or string
-            device_types (list, str optional): List or string of device_type(s)
-                to return. Defaults to None.
-
-        """
+    def device_list_item(cls, model, sub_device_no=0):
+        # Copy the memoized template - the library mutates list items
+        # in place (set_dev_id), so callers get their own dict.
+        return cls._device_list_item_template(model, sub_device_no).copy()
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _device_list_response_template(cls, device_types=None, _types=None):
+        """Assemble the get_devices response once per argument set."""
         response_base = copy.deepcopy(cls.list_response_base)
         if _types is not None:
-            if isinstance(_types, list):
+            if isinstance(_types, tuple):
                 full_model_list = {}
                 for _type in _types:
                     device_types = full_model_list.update(cls.__dict__[_type])
@@ -202,7 +221,7 @@ class DeviceList:
         else:
             full_model_list = {**cls.bulbs, **cls.outlets, **cls.fans, **cls.switches}
         if device_types is not None:
-            if isinstance(device_types, list):
+            if isinstance(device_types, tuple):
                 full_model_list = {k: v for k, v in full_model_list.items()
                                    if k in device_types}
             else:
@@ -213,6 +232,26 @@ class DeviceList:
             response_base['result']['total'] += 1
         return response_base
 
+    @classmethod
+    def device_list_response(cls, device_types=None, _types=None):
+        """Class method that returns the api get_devices response
+
+        Args:
+            _types (list, str, optional): Can be one or list of types of devices.
+                Defaults to None. can be bulb, fans, switches, outlets in list or string
+            device_types (list, str optional): List or string of device_type(s)
+                to return. Defaults to None.
+
+        """
+        if isinstance(device_types, list):
+            device_types = tuple(device_types)
+        if isinstance(_types, list):
+            _types = tuple(_types)
+        # process_devices filters the inner list in place, so each call
+        # returns a deep copy of the memoized template.
+        return copy.deepcopy(
+            cls._device_list_response_template(device_types, _types))
+
     LIST_CONF_7A = {
         'deviceType': 'wifi-switch-1.3',
         'extension': None,
@@ -602,6 +641,10 @@ def get_details_body():
     return body
 
 
+# Shared across test modules as a mock call_api() return value - never
+# mutate it.  It must stay a plain dict (not MappingProxyType) because
+# the library gates responses with `isinstance(r, dict)`; a proxy would
+# divert these tests onto the wrong-type branch instead of code != 0.
 DETAILS_BADCODE = {
     'code': 1,
     'msg' : 'FAILED',
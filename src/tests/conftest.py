@@ -1,3 +1,22 @@
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture(scope='class')
+def class_mock_api(request):
+    """Patch call_api() once per test class.
+
+    Starting and stopping the patcher is the expensive part of the
+    per-test setup; `TestBase.setup` resets the mock between tests.
+    Class scope keeps the patch inactive for test classes that exercise
+    the real `call_api`.
+    """
+    patcher = patch('pyvesync.helpers.Helpers.call_api')
+    request.cls.mock_api = patcher.start()
+    yield
+    patcher.stop()
+
+
 def pytest_addoption(parser):
     """Prevent new API's from being written during pipeline tests."""
     parser.addoption(
@@ -27,10 +46,10 @@ def pytest_generate_tests(metafunc):
         if device not in metafunc.cls.__dict__:
             return
         devices = metafunc.cls.__dict__[device]
-        if metafunc.function.__name__ == 'test_details':
+        if metafunc.function.__name__ in ('test_details', 'test_details_badcode'):
             return details_generator(metafunc, device, devices)
 
-        elif metafunc.function.__name__ == 'test_methods':
+        elif metafunc.function.__name__ in ('test_methods', 'test_methods_badcode'):
             return method_generator(metafunc, device, devices)
 
 
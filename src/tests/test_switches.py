@@ -27,6 +27,8 @@ See Also
 """
 
 import logging
+from types import MappingProxyType
+from pyvesync import vesyncswitch
 from utils import TestBase, assert_test, parse_args, Defaults
 import call_json
 import call_json_switches
@@ -36,11 +38,13 @@ _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.DEBUG)
 
 DEFAULT_COLOR = Defaults.color.rgb
-COLOR_DICT = {
+# Read-only view - the dict is shared across every parametrized case, so
+# an accidental in-test mutation raises instead of leaking into siblings.
+COLOR_DICT = MappingProxyType({
     'red': DEFAULT_COLOR.red,
     'blue': DEFAULT_COLOR.blue,
     'green': DEFAULT_COLOR.green,
-}
+})
 
 
 class TestSwitches(TestBase):
@@ -133,7 +137,7 @@ class TestSwitches(TestBase):
         switch_obj = self.manager.object_factory(device_config)
 
         # Get method from device object
-        method_call = getattr(switch_obj, method)
+        method_call = METHOD_TABLE[(dev_type, method)].__get__(switch_obj)
         method_call()
 
         # Parse mock_api args tuple from arg, kwargs to kwargs
@@ -149,8 +153,17 @@ class TestSwitches(TestBase):
             assert switch_obj.indicator_light_status == 'on'
             assert switch_obj.rgb_light_status == 'on'
             assert switch_obj.rgb_light_value == COLOR_DICT
-        self.mock_api.reset_mock()
+
+    def test_details_badcode(self, dev_type, method):
+        """Test the device details error handling on a bad response code.
+
+        Parametrized like `test_details`; split out so the failure path
+        is an independent test case.
+        """
         self.mock_api.return_value = call_json.DETAILS_BADCODE
+        device_config = call_json.DeviceList.device_list_item(dev_type)
+        switch_obj = self.manager.object_factory(device_config)
+        method_call = METHOD_TABLE[(dev_type, method)].__get__(switch_obj)
         method_call()
         assert 'details' in self.caplog.records[-1].message
 
@@ -184,7 +197,7 @@ class TestSwitches(TestBase):
         """
         # Get method name and kwargs from method fixture
         method_name = method[0]
-        if len(method) == 2 and isinstance(method[1], dict):
+        if len(method) == 2 and isinstance(method[1], (dict, MappingProxyType)):
             method_kwargs = method[1]
         else:
             method_kwargs = {}
@@ -206,7 +219,7 @@ class TestSwitches(TestBase):
         switch_obj = self.manager.object_factory(device_config)
 
         # Get method from device object
-        method_call = getattr(switch_obj, method[0])
+        method_call = METHOD_TABLE[(dev_type, method_name)].__get__(switch_obj)
 
         # Ensure method runs based on device configuration
         if method[0] == 'turn_on':
@@ -226,9 +239,45 @@ class TestSwitches(TestBase):
         # Assert request matches recored request or write new records
         assert_test(method_call, all_kwargs, dev_type, self.write_api, self.overwrite)
 
-        self.mock_api.reset_mock()
+    def test_methods_badcode(self, dev_type, method):
+        """Test that switch methods return False on a bad response code.
+
+        Parametrized like `test_methods`; split out so the failure path
+        is an independent test case.
+        """
+        method_name = method[0]
+        if len(method) == 2 and isinstance(method[1], (dict, MappingProxyType)):
+            method_kwargs = method[1]
+        else:
+            method_kwargs = {}
         self.mock_api.return_value = call_json.DETAILS_BADCODE
+        device_config = call_json.DeviceList.device_list_item(dev_type)
+        switch_obj = self.manager.object_factory(device_config)
+        method_call = METHOD_TABLE[(dev_type, method_name)].__get__(switch_obj)
+        if method_name == 'turn_on':
+            switch_obj.device_status = 'off'
+        elif method_name == 'turn_off':
+            switch_obj.device_status = 'on'
         if method_kwargs:
             assert method_call(**method_kwargs) is False
         else:
             assert method_call() is False
+
+
+def _build_method_table() -> dict:
+    """Resolve every parametrized method to its function once.
+
+    Binding the precomputed function to the device instance in the test
+    body avoids repeating the MRO walk for each parametrized case.
+    """
+    table = {}
+    for dev_type in call_json_switches.SWITCHES:
+        cls = getattr(vesyncswitch, vesyncswitch.switch_classes[dev_type])
+        names = {'update'}
+        names.update(m[0] for m in TestSwitches.base_methods)
+        names.update(m[0] for m in TestSwitches.device_methods.get(dev_type, []))
+        table.update({(dev_type, name): getattr(cls, name) for name in names})
+    return table
+
+
+METHOD_TABLE = _build_method_table()
@@ -120,7 +120,7 @@ class TestVeSync(unittest.TestCase):
 class TestApiFunc:
     """Test call_api() method."""
 
-    @patch('pyvesync.helpers.requests.get', autospec=True)
+    @patch('pyvesync.helpers._SESSION.request', autospec=True)
     def test_api_get(self, get_mock):
         """Test get api call."""
         get_mock.return_value = Mock(ok=True, status_code=200)
@@ -134,7 +134,7 @@ class TestApiFunc:
 
         assert mock_return == {'code': 0}
 
-    @patch('pyvesync.helpers.requests.post', autospec=True)
+    @patch('pyvesync.helpers._SESSION.request', autospec=True)
     def test_api_post(self, post_mock):
         """Test post api call."""
         post_mock.return_value = Mock(ok=True, status_code=200)
@@ -148,7 +148,7 @@ class TestApiFunc:
 
         assert mock_return == {'code': 0}
 
-    @patch('pyvesync.helpers.requests.put', autospec=True)
+    @patch('pyvesync.helpers._SESSION.request', autospec=True)
     def test_api_put(self, put_mock):
         """Test put api call."""
         put_mock.return_value = Mock(ok=True, status_code=200)
@@ -161,7 +161,7 @@ class TestApiFunc:
 
         assert mock_return == {'code': 0}
 
-    @patch('pyvesync.helpers.requests.get', autospec=True)
+    @patch('pyvesync.helpers._SESSION.request', autospec=True)
     def test_api_bad_response(self, api_mock):
         """Test bad API response handling."""
         api_mock.side_effect = MagicMock(status_code=400)
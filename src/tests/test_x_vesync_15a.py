@@ -42,8 +42,8 @@ class TestVeSyncSwitch(utils.TestBase):
         assert type(dev_details) == dict
         assert dev_details['active_time'] == 1
         assert dev_details['energy'] == 1
-        assert dev_details['power'] == '1'
-        assert dev_details['voltage'] == '1'
+        assert dev_details['power'] == 1.0
+        assert dev_details['voltage'] == 1.0
         assert vswitch15a.power == 1
         assert vswitch15a.voltage == 1
         assert vswitch15a.active_time == 1
@@ -57,9 +57,10 @@ class TestVeSyncBSDGO1Switch(TestBase):
         bsdgo1_outlet = VeSyncOutletBSDGO1(DEV_LIST_DETAIL, self.manager)
         bsdgo1_outlet.get_details()
         assert len(self.caplog.records) == 1
-        assert 'FAILED' in self.caplog.text
+        assert 'FAILED' in self.caplog.records[0].message
 
-    def test_bsdgo1_onoff(self):
+    @pytest.mark.parametrize(('action', 'power'), [('turn_on', 1), ('turn_off', 0)])
+    def test_bsdgo1_onoff(self, action, power):
         """Test BSDGO1 Device On/Off Methods."""
         self.mock_api.return_value = {'code': 0, 'msg': 'success', 'result': {'code': 0}}
         bsdgo1_outlet = VeSyncOutletBSDGO1(DEV_LIST_DETAIL, self.manager)
@@ -71,20 +72,10 @@ class TestVeSyncBSDGO1Switch(TestBase):
             'payload': {
                 'method': 'setProperty',
                 'source': 'APP',
-                'data': {'powerSwitch_1': 1}
+                'data': {'powerSwitch_1': power}
             }
         }
-        assert bsdgo1_outlet.turn_on()
-        self.mock_api.assert_called_with(
-            api='/cloud/v2/deviceManaged/bypassV2',
-            method='post',
-            headers=head,
-            json_object=body,
-        )
-
-        # Test turn_off
-        body['payload']['data']['powerSwitch_1'] = 0
-        assert bsdgo1_outlet.turn_off()
+        assert getattr(bsdgo1_outlet, action)()
         self.mock_api.assert_called_with(
             api='/cloud/v2/deviceManaged/bypassV2',
             method='post',
@@ -1,6 +1,6 @@
 """Test scripts for Etekcity Outdoor Outlet."""
+import pytest
 from typing import Any, Dict, Union
-from copy import deepcopy
 from pyvesync.vesyncoutlet import VeSyncOutdoorPlug
 from pyvesync.helpers import Helpers as helpers
 import call_json
@@ -14,9 +14,11 @@ DEV_LIST_DETAIL: Dict[str, Union[str, int, float]
 
 DEV_LIST_DETAIL_2: Dict[str, Any] = call_json.DeviceList.device_list_item(DEVICE_TYPE, 1)
 
-CORRECT_OUTDOOR_LIST: Dict[str, Any] = deepcopy(call_json.DeviceList.list_response_base)
-CORRECT_OUTDOOR_LIST['result']['list'].extend([DEV_LIST_DETAIL, DEV_LIST_DETAIL_2])
-CORRECT_OUTDOOR_RESP: dict = CORRECT_OUTDOOR_LIST
+
+def outdoor_list() -> Dict[str, Any]:
+    """Device list response with both outdoor sub-sockets."""
+    return call_json.DeviceList.build_list_response(
+        DEV_LIST_DETAIL, DEV_LIST_DETAIL_2)
 
 
 ENERGY_HISTORY: dict = call_json_outlets.ENERGY_HISTORY
@@ -33,7 +35,7 @@ class TestVeSyncOutdoorPlug(TestBase):
 
     def test_outdoor_conf(self):
         """Tests outdoor outlet is instantiated properly."""
-        self.mock_api.return_value = CORRECT_OUTDOOR_RESP
+        self.mock_api.return_value = outdoor_list()
         self.manager.get_devices()
         outlets = self.manager.outlets
         assert len(outlets) == 2
@@ -58,33 +60,26 @@ class TestVeSyncOutdoorPlug(TestBase):
         outdoor_outlet = VeSyncOutdoorPlug(DEV_LIST_DETAIL, self.manager)
         outdoor_outlet.get_details()
         assert len(caplog.records) == 1
-        assert 'details' in caplog.text
+        assert 'details' in caplog.records[0].message
 
-    def test_outdoor_outlet_onoff(self):
+    @pytest.mark.parametrize(('action', 'status'), [('turn_on', 'on'), ('turn_off', 'off')])
+    def test_outdoor_outlet_onoff(self, action, status):
         """Test Outdoor Outlet Device On/Off Methods."""
         self.mock_api.return_value = {'code': 0}
         outdoor_outlet = VeSyncOutdoorPlug(DEV_LIST_DETAIL, self.manager)
         head = self.manager.req_headers()
         body = self.manager.req_body_status()
 
-        body['status'] = 'on'
+        body['status'] = status
         body['uuid'] = outdoor_outlet.uuid
         body['switchNo'] = outdoor_outlet.sub_device_no
-        assert outdoor_outlet.turn_on()
+        assert getattr(outdoor_outlet, action)()
         self.mock_api.assert_called_with(
             '/outdoorsocket15a/v1/device/devicestatus',
             method='put',
             headers=head,
             json_object=body
         )
-        assert outdoor_outlet.turn_off()
-        body['status'] = 'off'
-        self.mock_api.assert_called_with(
-            '/outdoorsocket15a/v1/device/devicestatus', 
-            method='put',
-            headers=head,
-            json_object=body
-        )
 
     def test_outdoor_outlet_onoff_fail(self):
         """Test outdoor outlet On/Off Fail with Code>0."""
@@ -93,82 +88,34 @@ class TestVeSyncOutdoorPlug(TestBase):
         assert not outdoor_outlet.turn_on()
         assert not outdoor_outlet.turn_off()
 
-    def test_outdoor_outlet_weekly(self):
-        """Test outdoor outlet get_weekly_energy."""
-        self.mock_api.return_value = ENERGY_HISTORY
-        outdoor_outlet = VeSyncOutdoorPlug(DEV_LIST_DETAIL, self.manager)
-        outdoor_outlet.get_weekly_energy()
-        body = self.manager.req_body_energy_week()
-        body['uuid'] = outdoor_outlet.uuid
-        self.mock_api.assert_called_with(
-            '/outdoorsocket15a/v1/device/energyweek',
-            method='post',
-            headers=self.manager.req_headers(),
-            json_object=body,
-        )
-        energy_dict = outdoor_outlet.energy['week']
-        assert energy_dict['energy_consumption_of_today'] == 1
-        assert energy_dict['cost_per_kwh'] == 1
-        assert energy_dict['max_energy'] == 1
-        assert energy_dict['total_energy'] == 1
-        assert energy_dict['data'] == [1, 1]
-        assert outdoor_outlet.weekly_energy_total == 1
-
-    def test_outdoor_outlet_monthly(self):
-        """Test outdoor outlet get_monthly_energy."""
-        self.mock_api.return_value = ENERGY_HISTORY
-        outdoor_outlet = VeSyncOutdoorPlug(DEV_LIST_DETAIL, self.manager)
-        outdoor_outlet.get_monthly_energy()
-        body = self.manager.req_body_energy_month()
-        body['uuid'] = outdoor_outlet.uuid
-        self.mock_api.assert_called_with(
-            '/outdoorsocket15a/v1/device/energymonth',
-            method='post',
-            headers=self.manager.req_headers(),
-            json_object=body,
-        )
-        energy_dict = outdoor_outlet.energy['month']
-        assert energy_dict['energy_consumption_of_today'] == 1
-        assert energy_dict['cost_per_kwh'] == 1
-        assert energy_dict['max_energy'] == 1
-        assert energy_dict['total_energy'] == 1
-        assert energy_dict['data'] == [1, 1]
-        assert outdoor_outlet.monthly_energy_total == 1
-
-    def test_outdoor_outlet_yearly(self):
-        """Test outdoor outlet get_yearly_energy."""
+    @pytest.mark.parametrize('period', ['week', 'month', 'year'])
+    def test_outdoor_outlet_energy(self, period):
+        """Test outdoor outlet energy history for one period."""
         self.mock_api.return_value = ENERGY_HISTORY
         outdoor_outlet = VeSyncOutdoorPlug(DEV_LIST_DETAIL, self.manager)
-        outdoor_outlet.get_yearly_energy()
-        body = self.manager.req_body_energy_year()
+        getattr(outdoor_outlet, f'get_{period}ly_energy')()
+        body = getattr(self.manager, f'req_body_energy_{period}')()
         body['uuid'] = outdoor_outlet.uuid
         self.mock_api.assert_called_with(
-            '/outdoorsocket15a/v1/device/energyyear',
+            f'/outdoorsocket15a/v1/device/energy{period}',
             method='post',
             headers=self.manager.req_headers(),
             json_object=body,
         )
-        energy_dict = outdoor_outlet.energy['year']
+        energy_dict = outdoor_outlet.energy[period]
         assert energy_dict['energy_consumption_of_today'] == 1
         assert energy_dict['cost_per_kwh'] == 1
         assert energy_dict['max_energy'] == 1
         assert energy_dict['total_energy'] == 1
         assert energy_dict['data'] == [1, 1]
-        assert outdoor_outlet.yearly_energy_total == 1
+        assert getattr(outdoor_outlet, f'{period}ly_energy_total') == 1
 
-    def test_history_fail(self):
-        """Test outdoor outlet energy failure."""
+    @pytest.mark.parametrize('period', ['week', 'month', 'year'])
+    def test_history_fail(self, period):
+        """Test outdoor outlet energy failure for one period."""
         bad_history = {'code': 1, 'msg': 'failed', 'result': {}}
         self.mock_api.return_value = bad_history
         outdoor_outlet = VeSyncOutdoorPlug(DEV_LIST_DETAIL, self.manager)
-        outdoor_outlet.update_energy()
-        assert len(self.caplog.records) == 1
-        assert 'week' in self.caplog.text
-        self.caplog.clear()
-        outdoor_outlet.get_monthly_energy()
-        assert len(self.caplog.records) == 1
-        assert 'month' in self.caplog.text
-        self.caplog.clear()
-        outdoor_outlet.get_yearly_energy()
+        getattr(outdoor_outlet, f'get_{period}ly_energy')()
         assert len(self.caplog.records) == 1
-        assert 'year' in self.caplog.text
+        assert period in self.caplog.records[0].message
@@ -10,6 +10,7 @@ Defaults: class
 TestBase: class
     Base class for tests to start mock & instantiat VS object
 """
+import functools
 import logging
 from pathlib import Path
 from typing import Any
@@ -208,6 +209,10 @@ class YAMLWriter:
 
     """
 
+    #: Parsed YAML per file, shared across writers - each recorded API
+    #: file is parsed once per session instead of once per assertion.
+    _yaml_cache: dict = {}
+
     def __init__(self, module, dev_type):
         """Init the YAMLWriter class.
 
@@ -225,6 +230,7 @@ class YAMLWriter:
         self._existing_api = None
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _get_path(module) -> Path:
         yaml_dir = Path.joinpath(Path(__file__).parent, 'api', module)
         if not yaml_dir.exists():
@@ -241,9 +247,10 @@ class YAMLWriter:
     def _get_existing_yaml(self) -> Any:
         if self.new_file:
             return None
-        with open(self.file, 'rb') as f:
-            data = yaml.full_load(f)
-        return data
+        if self.file not in self._yaml_cache:
+            with open(self.file, 'rb') as f:
+                self._yaml_cache[self.file] = yaml.full_load(f)
+        return self._yaml_cache[self.file]
 
     def existing_api(self, method) -> bool:
         """Check YAML file for existing data for API call.
@@ -286,6 +293,7 @@ class YAMLWriter:
             self.existing_yaml[method] = yaml_dict
         else:
             self.existing_yaml = {method: yaml_dict}
+        self._yaml_cache[self.file] = self.existing_yaml
         with open(self.file, 'w', encoding='utf-8') as f:
             yaml.dump(self.existing_yaml, f, encoding='utf-8')
 
@@ -349,8 +357,8 @@ class TestBase:
     write_api = False
 
     @pytest.fixture(autouse=True, scope='function')
-    def setup(self, caplog):
-        """Fixture to instantiate VeSync object, start logging and start Mock.
+    def setup(self, caplog, class_mock_api):
+        """Fixture to instantiate VeSync object, start logging and reset Mock.
 
         Attributes
         ----------
@@ -362,10 +370,8 @@ class TestBase:
         ------
         Class instance with mocked call_api() function and VeSync object
         """
-        self.mock_api_call = patch('pyvesync.helpers.Helpers.call_api')
         self.caplog = caplog
-        self.mock_api = self.mock_api_call.start()
-        self.mock_api.create_autospect()
+        self.mock_api.reset_mock(return_value=True, side_effect=True)
         self.mock_api.return_value.ok = True
         self.manager = VeSync('EMAIL', 'PASSWORD', debug=True)
         self.manager.enabled = True
@@ -373,7 +379,6 @@ class TestBase:
         self.manager.account_id = Defaults.account_id
         caplog.set_level(logging.DEBUG)
         yield
-        self.mock_api_call.stop()
 
 
 def assert_test(test_func, all_kwargs, dev_type=None, write_api=False, overwrite=False):